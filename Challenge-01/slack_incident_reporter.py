@@ -8,12 +8,19 @@ and generates structured incident reports as local HTML files.
 
 import os
 import sys
-import json
+import atexit
 import datetime
+import threading
+import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from string import Template
 import markdown
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
 from dotenv import load_dotenv
 import groq
@@ -27,6 +34,195 @@ SLACK_USER_TOKEN = os.getenv("SLACK_USER_TOKEN")
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 SLACK_CHANNEL_ID = os.getenv("SLACK_CHANNEL_ID", "C085J2WR1TN")
 
+# Cap on concurrent users.info requests, to stay within Slack's rate limits
+USER_LOOKUP_WORKERS = 15
+
+# How long user info cached on disk is reused before being fetched again
+USER_CACHE_TTL = 24 * 60 * 60
+
+# Precompiled patterns for stripping Slack formatting. Mentions and URLs are
+# dropped in one pass before any emphasis is unwrapped, so underscores or
+# asterisks inside a link can't start an emphasis match. The emphasis passes
+# stay separate and in this order: a single alternation would let the leftmost
+# marker win and change how overlapping markers are resolved.
+_RE_DROP = re.compile(r'<[@#][A-Z0-9]+>|<https?://[^>]+>')
+_RE_EMPHASIS = (
+    re.compile(r'\*(.*?)\*'),  # bold
+    re.compile(r'_(.*?)_'),  # italic
+    re.compile(r'~(.*?)~'),  # strikethrough
+    re.compile(r'`(.*?)`'),  # code
+)
+_RE_WS = re.compile(r'\s+')
+
+
+class _FilenameTable(dict):
+    """
+    str.translate table that keeps alphanumerics, spaces, hyphens and
+    underscores and deletes everything else. Each character is classified
+    once and then looked up at C speed.
+    """
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        self[codepoint] = char if char.isalnum() or char in ' -_' else None
+        return self[codepoint]
+
+
+_FILENAME_TABLE = _FilenameTable()
+
+
+def _is_bot_message(message):
+    """Returns True for bot posts, which carry their own display name."""
+    return message.get('subtype') == 'bot_message' or 'bot_id' in message
+
+
+def _assemble_conversation(timestamps, usernames, texts):
+    """Joins already-cleaned message fields into the transcript sent for analysis."""
+    return "\n".join(
+        f"[{timestamp}] {username}: {text}"
+        for timestamp, username, text in zip(timestamps, usernames, texts)
+    )
+
+
+def _markdown_list(items, numbered=False):
+    """Renders a list of strings from the analysis as a Markdown list."""
+    if not items:
+        return ""
+    if isinstance(items, str):
+        # Tolerate the model returning pre-rendered Markdown instead of an array
+        return items
+    if numbered:
+        return "\n".join(f"{i}. {item}" for i, item in enumerate(items, 1))
+    return "\n".join(f"- {item}" for item in items)
+
+
+# Shape of the analysis returned by the model. Every key is required.
+_STRING = {"type": "string"}
+_STRING_LIST = {"type": "array", "items": _STRING}
+ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "summary": _STRING,
+        "author": {"type": "string", "description": "person who resolved the issue"},
+        "priority": {"enum": ["High", "Medium", "Low"]},
+        "status": {"enum": ["Resolved", "Investigating", "Monitoring"]},
+        "description": _STRING,
+        "category": {"type": "string", "description": "e.g. Infrastructure, Application, Database"},
+        "environment": {"type": "string", "description": "e.g. Production, Staging"},
+        "affected_resources": {"type": "string", "description": "comma-separated"},
+        "root_cause_text": _STRING,
+        "remediation_steps_text": _STRING,
+        "impact_text": _STRING,
+        "timeline": {
+            "type": "array",
+            "items": _STRING,
+            "description": "one event per item, e.g. \"[2025-01-22 15:30:45] - Ajay noticed that storage is full.\"",
+        },
+        "what_went_well": _STRING_LIST,
+        "what_went_wrong": _STRING_LIST,
+    },
+}
+ANALYSIS_SCHEMA["required"] = list(ANALYSIS_SCHEMA["properties"])
+
+# Kept short on purpose: prompt length adds directly to Groq latency
+SYSTEM_PROMPT = f"""\
+You are an incident response analyst writing a report from a Slack thread transcript.
+Reply with only a JSON object containing every key of this JSON schema:
+{orjson.dumps(ANALYSIS_SCHEMA).decode()}
+Array items are rendered as list entries, so do not add bullets or numbering.
+Use the EXACT [YYYY-MM-DD HH:MM:SS] timestamps from the transcript, never generic times."""
+
+
+# CSS for styling the HTML reports, saved as styles.css alongside them
+REPORT_CSS = """\
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    line-height: 1.6;
+    max-width: 1200px;
+    margin: 0 auto;
+    padding: 20px;
+    background-color: #f5f5f5;
+}
+.container {
+    background: white;
+    padding: 30px;
+    border-radius: 8px;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+}
+h1 {
+    color: #2c3e50;
+    border-bottom: 3px solid #3498db;
+    padding-bottom: 10px;
+}
+h2 {
+    color: #34495e;
+    margin-top: 30px;
+}
+h3 {
+    color: #7f8c8d;
+}
+table {
+    width: 100%;
+    border-collapse: collapse;
+    margin: 20px 0;
+}
+th, td {
+    border: 1px solid #ddd;
+    padding: 12px;
+    text-align: left;
+}
+th {
+    background-color: #3498db;
+    color: white;
+    font-weight: bold;
+}
+tr:nth-child(even) {
+    background-color: #f2f2f2;
+}
+.priority-high {
+    color: #e74c3c;
+    font-weight: bold;
+}
+.priority-medium {
+    color: #f39c12;
+    font-weight: bold;
+}
+.priority-low {
+    color: #27ae60;
+    font-weight: bold;
+}
+.status-resolved {
+    color: #27ae60;
+    font-weight: bold;
+}
+.status-investigating {
+    color: #f39c12;
+    font-weight: bold;
+}
+.status-monitoring {
+    color: #3498db;
+    font-weight: bold;
+}
+ul, ol {
+    margin: 10px 0;
+    padding-left: 20px;
+}
+li {
+    margin: 5px 0;
+}
+.metadata {
+    background-color: #ecf0f1;
+    padding: 15px;
+    border-radius: 5px;
+    margin: 20px 0;
+}
+.section {
+    margin-bottom: 30px;
+    border-bottom: 1px solid #eee;
+    padding-bottom: 20px;
+}
+"""
+
 # Validate environment variables
 required_env_vars = [
     "SLACK_BOT_TOKEN", "SLACK_USER_TOKEN", 
@@ -39,200 +235,251 @@ if missing_vars:
     print("Please set these variables in a .env file or in your environment.")
     sys.exit(1)
 
+class IncidentReportError(Exception):
+    """Raised when an incident report cannot be produced."""
+
+
 class SlackIncidentReporter:
+    # Shell of every HTML report; only the per-report values are substituted
+    _HTML_TMPL = Template("""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$title</title>
+    <link rel="stylesheet" href="styles.css">
+</head>
+<body>
+    <div class="container">
+        <h1>$title</h1>
+        <div class="metadata">
+            <strong>Generated on:</strong> $generated_on<br>
+            <strong>Incident Date:</strong> $incident_date
+        </div>
+        $body
+    </div>
+</body>
+</html>
+""")
+
     def __init__(self):
         """Initialize the Slack Incident Reporter."""
-        # Groq client
-        self.groq_client = groq.Groq(api_key=GROQ_API_KEY)
+        # Groq client; rate-limited (429) and failed calls are retried with backoff
+        self.groq_client = groq.Groq(api_key=GROQ_API_KEY, max_retries=5)
+        
+        # Shared Slack session: keep-alive reuses connections across API calls,
+        # and rate-limited (429) or failed requests are retried with backoff
+        self._session = requests.Session()
+        self._session.headers.update({"Authorization": f"Bearer {SLACK_BOT_TOKEN}"})
+        retries = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(max_retries=retries, pool_maxsize=USER_LOOKUP_WORKERS)
+        self._session.mount("https://", adapter)
         
         # Create reports directory if it doesn't exist
         self.reports_dir = Path("incident_reports")
         self.reports_dir.mkdir(exist_ok=True)
         
-        # CSS for styling the HTML reports
-        self.css = """
-        <style>
-            body {
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                line-height: 1.6;
-                max-width: 1200px;
-                margin: 0 auto;
-                padding: 20px;
-                background-color: #f5f5f5;
-            }
-            .container {
-                background: white;
-                padding: 30px;
-                border-radius: 8px;
-                box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            }
-            h1 {
-                color: #2c3e50;
-                border-bottom: 3px solid #3498db;
-                padding-bottom: 10px;
-            }
-            h2 {
-                color: #34495e;
-                margin-top: 30px;
-            }
-            h3 {
-                color: #7f8c8d;
-            }
-            table {
-                width: 100%;
-                border-collapse: collapse;
-                margin: 20px 0;
-            }
-            th, td {
-                border: 1px solid #ddd;
-                padding: 12px;
-                text-align: left;
-            }
-            th {
-                background-color: #3498db;
-                color: white;
-                font-weight: bold;
-            }
-            tr:nth-child(even) {
-                background-color: #f2f2f2;
-            }
-            .priority-high {
-                color: #e74c3c;
-                font-weight: bold;
-            }
-            .priority-medium {
-                color: #f39c12;
-                font-weight: bold;
-            }
-            .priority-low {
-                color: #27ae60;
-                font-weight: bold;
-            }
-            .status-resolved {
-                color: #27ae60;
-                font-weight: bold;
-            }
-            .status-investigating {
-                color: #f39c12;
-                font-weight: bold;
-            }
-            .status-monitoring {
-                color: #3498db;
-                font-weight: bold;
-            }
-            ul, ol {
-                margin: 10px 0;
-                padding-left: 20px;
-            }
-            li {
-                margin: 5px 0;
-            }
-            .metadata {
-                background-color: #ecf0f1;
-                padding: 15px;
-                border-radius: 5px;
-                margin: 20px 0;
-            }
-            .section {
-                margin-bottom: 30px;
-                border-bottom: 1px solid #eee;
-                padding-bottom: 20px;
-            }
-        </style>
-        """
+        # Cache of Slack user info keyed by user ID, so each user is fetched once.
+        # It is persisted between runs; with a warm cache, the users.list pass is
+        # skipped and only users not seen recently are looked up.
+        self._user_cache_path = self.reports_dir / ".user_cache.json"
+        self._user_cache = self._load_user_cache()
+        self._users_primed = bool(self._user_cache)
+        atexit.register(self._save_user_cache)
+        
+        # Markdown converter, reused across reports instead of rebuilt per call
+        self._md = markdown.Markdown(extensions=['tables'], output_format='html5')
+        
+        # Stylesheet shared by every HTML report, written once rather than
+        # embedded in each file
+        css_path = self.reports_dir / "styles.css"
+        if not css_path.exists() or css_path.read_text(encoding='utf-8') != REPORT_CSS:
+            css_path.write_text(REPORT_CSS, encoding='utf-8')
 
     def get_slack_user(self, user_id):
-        """Fetches user information from Slack."""
-        headers = {"Authorization": f"Bearer {SLACK_BOT_TOKEN}"}
+        """Fetches user information from Slack, caching results per user ID."""
+        if user_id in self._user_cache:
+            return self._user_cache[user_id]
+        
         url = "https://slack.com/api/users.info"
         params = {"user": user_id}
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self._session.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             if data.get('ok'):
-                return data['user']
+                user_info = data['user']
+                user_info['_fetched'] = time.time()
             else:
                 print(f"Warning: Could not fetch user {user_id}. Error: {data.get('error')}")
-                return {}
-        except requests.exceptions.RequestException as e:
+                user_info = {}
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"Warning: Could not fetch user {user_id}. Error: {e}")
-            return {}
-
-    def clean_slack_formatting(self, text):
-        """Removes Slack-specific formatting from text."""
-        # Remove user mentions <@U123456>
-        text = re.sub(r'<@[A-Z0-9]+>', '', text)
+            user_info = {}
         
-        # Remove channel mentions <#C123456>
-        text = re.sub(r'<#[A-Z0-9]+>', '', text)
+        # Cache failures too, so a missing user isn't re-requested for every message
+        self._user_cache[user_id] = user_info
+        return user_info
+
+    def _load_user_cache(self):
+        """Loads user info cached by previous runs, dropping expired entries."""
+        try:
+            cached = orjson.loads(self._user_cache_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+        # The file is disposable; ignore it, or any malformed entry, rather than fail
+        if not isinstance(cached, dict):
+            return {}
         
-        # Remove URLs <https://example.com>
-        text = re.sub(r'<https?://[^>]+>', '', text)
+        now = time.time()
+        return {
+            user_id: user_info for user_id, user_info in cached.items()
+            if isinstance(user_info, dict)
+            and isinstance(user_info.get('_fetched'), (int, float))
+            and now - user_info['_fetched'] < USER_CACHE_TTL
+        }
+
+    def _save_user_cache(self):
+        """Persists successfully fetched user names for reuse by later runs."""
+        # Failed lookups (no '_fetched' time) are not saved, so they are retried next run
+        cached = {
+            user_id: {key: user_info[key] for key in ('name', 'real_name', '_fetched') if key in user_info}
+            for user_id, user_info in self._user_cache.items()
+            if '_fetched' in user_info
+        }
+        try:
+            self._user_cache_path.write_bytes(orjson.dumps(cached))
+        except OSError as e:
+            print(f"Warning: Could not save user cache. Error: {e}")
+
+    def _prime_user_cache(self, user_ids=None, stop=None):
+        """
+        Bulk-loads workspace members into the user cache via users.list.
         
-        # Remove bold formatting *text*
-        text = re.sub(r'\*(.*?)\*', r'\1', text)
+        Pages through users.list, stopping early once every ID in user_ids
+        has been resolved or once the stop event is set. Anything still
+        missing afterwards is looked up per user by _fetch_users.
+        """
+        if self._users_primed:
+            return
+        self._users_primed = True
         
-        # Remove italic formatting _text_
-        text = re.sub(r'_(.*?)_', r'\1', text)
+        url = "https://slack.com/api/users.list"
+        params = {"limit": 1000}
+        pending = set(user_ids or ()) - self._user_cache.keys()
+        try:
+            while True:
+                response = self._session.get(url, params=params)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+                if not data.get('ok'):
+                    print(f"Warning: Could not list users. Error: {data.get('error')}")
+                    return
+                
+                fetched = time.time()
+                for member in data.get('members', []):
+                    member['_fetched'] = fetched
+                    self._user_cache[member['id']] = member
+                    pending.discard(member['id'])
+                
+                cursor = data.get('response_metadata', {}).get('next_cursor')
+                if not cursor or (user_ids and not pending) or (stop and stop.is_set()):
+                    return
+                params["cursor"] = cursor
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            print(f"Warning: Could not list users. Error: {e}")
+
+    def _fetch_users(self, user_ids):
+        """Fetches any users not already cached, running the lookups concurrently."""
+        missing = [user_id for user_id in user_ids if user_id not in self._user_cache]
+        if not missing:
+            return
         
-        # Remove strikethrough formatting ~text~
-        text = re.sub(r'~(.*?)~', r'\1', text)
+        with ThreadPoolExecutor(max_workers=min(USER_LOOKUP_WORKERS, len(missing))) as executor:
+            # get_slack_user stores each result in the cache
+            list(executor.map(self.get_slack_user, missing))
+
+    def clean_slack_formatting(self, text):
+        """Removes Slack-specific formatting from text."""
+        # Remove mentions (<@U123456>, <#C123456>) and URLs <https://example.com>
+        text = _RE_DROP.sub('', text)
         
-        # Remove code formatting `text`
-        text = re.sub(r'`(.*?)`', r'\1', text)
+        # Unwrap *bold*, _italic_, ~strikethrough~ and `code` formatting
+        for pattern in _RE_EMPHASIS:
+            text = pattern.sub(r'\1', text)
         
         # Clean up extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _RE_WS.sub(' ', text).strip()
         
         return text
 
     def fetch_slack_thread(self, channel_id, thread_ts):
         """Fetches all messages in a Slack thread."""
         print(f"Fetching Slack thread for channel: {channel_id}, thread_ts: {thread_ts}...")
-        headers = {"Authorization": f"Bearer {SLACK_BOT_TOKEN}"}
         url = "https://slack.com/api/conversations.replies"
         params = {
             "channel": channel_id,
-            "ts": thread_ts
+            "ts": thread_ts,
+            "limit": 200
         }
+        messages = []
         try:
-            response = requests.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
-            if not data.get('ok'):
-                print(f"Slack API error: {data.get('error')}")
-                sys.exit(1)
-            print("Successfully fetched thread.")
-            return data
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching Slack thread: {e}")
-            sys.exit(1)
+            # Replies are paginated; follow the cursor until every page is read
+            while True:
+                response = self._session.get(url, params=params)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+                if not data.get('ok'):
+                    raise IncidentReportError(f"Slack API error: {data.get('error')}")
+                
+                messages.extend(data.get('messages', []))
+                
+                cursor = data.get('response_metadata', {}).get('next_cursor')
+                if not cursor or not data.get('has_more'):
+                    break
+                params["cursor"] = cursor
+            print(f"Successfully fetched thread ({len(messages)} messages).")
+            return {"messages": messages}
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            raise IncidentReportError(f"Error fetching Slack thread: {e}") from e
 
     def format_conversation(self, thread_data):
         """Formats the thread messages into a single string."""
         messages = thread_data['messages']
         
-        conversation = []
-        for message in messages:
-            # Get timestamp
-            ts = float(message.get('ts', 0))
-            timestamp = datetime.datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S')
-            
-            # Get user info
-            user_id = message.get('user', 'unknown_user')
-            user_info = self.get_slack_user(user_id)
-            username = user_info.get('real_name', user_info.get('name', 'unknown_user'))
-            
-            # Get message text
-            text = message.get('text', '')
-            
-            # Handle message formatting (remove Slack formatting)
-            text = self.clean_slack_formatting(text)
-            
-            conversation.append(f"[{timestamp}] {username}: {text}")
-            
-        return "\n".join(conversation)
+        # Resolve all participants up front instead of one users.info call each.
+        # The users.list pass is skipped if process_incident already prefetched.
+        user_ids = {
+            message['user'] for message in messages
+            if 'user' in message and not _is_bot_message(message)
+        }
+        self._prime_user_cache(user_ids)
+        self._fetch_users(user_ids)
+        
+        # Convert all message timestamps in a single pass
+        fromtimestamp = datetime.datetime.fromtimestamp
+        timestamps = [
+            fromtimestamp(float(message.get('ts', 0))).strftime('%Y-%m-%d %H:%M:%S')
+            for message in messages
+        ]
+        
+        # Get user info
+        usernames = [self._username_for(message) for message in messages]
+        
+        # Handle message formatting (remove Slack formatting)
+        clean = self.clean_slack_formatting
+        texts = [clean(message.get('text', '')) for message in messages]
+        
+        return _assemble_conversation(timestamps, usernames, texts)
+
+    def _username_for(self, message):
+        """Returns the display name of a message's author, using the user cache."""
+        if _is_bot_message(message):
+            return message.get('username') or message.get('bot_profile', {}).get('name') or 'bot'
+        
+        user_info = self.get_slack_user(message.get('user', 'unknown_user'))
+        return user_info.get('real_name', user_info.get('name', 'unknown_user'))
 
     def analyze_with_groq(self, conversation):
         """
@@ -242,36 +489,13 @@ class SlackIncidentReporter:
         print("Analyzing conversation with Groq API...")
 
         try:
-            # This detailed prompt guides the AI to give us the exact format we need.
-            system_prompt = """
-            You are an expert incident response analyst tasked with creating a structured report from a Slack conversation transcript.
-            Your response MUST be a single, valid JSON object and nothing else. All values in the JSON object must be strings.
-            Analyze the conversation to identify key events, user actions, and outcomes.
-            
-            IMPORTANT: Use the EXACT timestamps from the conversation in the timeline_markdown field. Do not use generic times like "Unknown Time" or "10:09 PM". Use the full timestamp format [YYYY-MM-DD HH:MM:SS] as shown in the conversation.
-
-            The JSON object must contain these exact keys:
-            - "summary"
-            - "author" (Identify the primary person who resolved the issue)
-            - "priority" (Value must be one of: "High", "Medium", "Low")
-            - "status" (Value must be one of: "Resolved", "Investigating", "Monitoring")
-            - "description"
-            - "category" (e.g., "Infrastructure", "Application", "Database")
-            - "environment" (e.g., "Production", "Staging")
-            - "affected_resources" (Comma-separated list, e.g., "Jenkins, API Server")
-            - "root_cause_text"
-            - "remediation_steps_text"
-            - "impact_text"
-            - "timeline_markdown": "A detailed, multi-line timeline as a single JSON string. Each event must be a Markdown bullet point on a new line, using the EXACT timestamps from the conversation (format: [YYYY-MM-DD HH:MM:SS]). All newlines MUST be escaped as \\n. Example format: '- [2025-01-22 15:30:45] - Ajay noticed that storage is full.\\n- [2025-01-22 15:32:12] - Yuga cleaned up storage to free space.'"
-            - "what_went_well_markdown": "A Markdown numbered list as a single JSON string, describing what went well during the incident response. All newlines MUST be escaped as \\n."
-            - "what_went_wrong_markdown": "A Markdown numbered list as a single JSON string, describing what could be improved. All newlines MUST be escaped as \\n."
-            """
-
+            # Not streamed: Groq's JSON mode does not support stream=True, and the
+            # report can't be assembled until the complete JSON object is parsed.
             chat_completion = self.groq_client.chat.completions.create(
                 messages=[
                     {
                         "role": "system",
-                        "content": system_prompt,
+                        "content": SYSTEM_PROMPT,
                     },
                     {
                         "role": "user",
@@ -287,70 +511,61 @@ class SlackIncidentReporter:
             print("Analysis complete.")
             
             # Parse the JSON string from the AI into a Python dictionary
-            return json.loads(response_text)
+            return orjson.loads(response_text)
 
         except Exception as e:
-            print(f"Error during Groq API call: {e}")
-            sys.exit(1)
+            raise IncidentReportError(f"Error during Groq API call: {e}") from e
 
     def create_local_report(self, title, content, incident_date):
         """Creates a local HTML incident report."""
         print("Creating local incident report...")
+        generated_at = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         # Generate filename
-        safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        safe_title = safe_title.replace(' ', '_')
+        safe_title = title.translate(_FILENAME_TABLE).rstrip().replace(' ', '_')
         html_filename = f"{incident_date}_{safe_title}.html"
         md_filename = f"{incident_date}_{safe_title}.md"
         html_filepath = self.reports_dir / html_filename
         md_filepath = self.reports_dir / md_filename
         
-        # Save the original markdown content
-        try:
-            with open(md_filepath, 'w', encoding='utf-8') as f:
-                # Add title and metadata to the markdown file
-                md_header = f"# {title}\n\n"
-                md_header += f"**Generated on:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  \n"
-                md_header += f"**Incident Date:** {incident_date}\n\n"
-                f.write(md_header + content)
-            print(f"Successfully created markdown report: {md_filepath}")
-        except Exception as e:
-            print(f"Error creating markdown report: {e}")
+        # Add title and metadata to the markdown file
+        md_header = f"# {title}\n\n"
+        md_header += f"**Generated on:** {generated_at}  \n"
+        md_header += f"**Incident Date:** {incident_date}\n\n"
         
         # Convert markdown to HTML
-        html_content = markdown.markdown(content, extensions=['tables'])
+        html_content = self._md.reset().convert(content)
         
         # Create full HTML document
-        html_document = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    {self.css}
-</head>
-<body>
-    <div class="container">
-        <h1>{title}</h1>
-        <div class="metadata">
-            <strong>Generated on:</strong> {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br>
-            <strong>Incident Date:</strong> {incident_date}
-        </div>
-        {html_content}
-    </div>
-</body>
-</html>
-"""
+        html_document = self._HTML_TMPL.substitute(
+            title=title,
+            generated_on=generated_at,
+            incident_date=incident_date,
+            body=html_content,
+        )
+        
+        # Encode both reports up front, then write the bytes concurrently
+        md_bytes = (md_header + content).encode('utf-8')
+        html_bytes = html_document.encode('utf-8')
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            md_future = executor.submit(md_filepath.write_bytes, md_bytes)
+            html_future = executor.submit(html_filepath.write_bytes, html_bytes)
         
         try:
-            with open(html_filepath, 'w', encoding='utf-8') as f:
-                f.write(html_document)
-            
+            md_future.result()
+            print(f"Successfully created markdown report: {md_filepath}")
+        except Exception as e:
+            print(f"Error creating markdown report: {e}")
+        
+        try:
+            html_future.result()
             print(f"Successfully created HTML report: {html_filepath}")
             
-            # Open the report in the default browser
-            webbrowser.open(f'file://{os.path.abspath(html_filepath)}')
+            # Open the report in the default browser without blocking on its startup
+            threading.Thread(
+                target=webbrowser.open,
+                args=(f'file://{os.path.abspath(html_filepath)}',),
+            ).start()
             
             return str(html_filepath)
         except Exception as e:
@@ -367,12 +582,24 @@ class SlackIncidentReporter:
             
         Returns:
             str: Path to the generated HTML report
+            
+        Raises:
+            IncidentReportError: If the thread cannot be fetched or analyzed
         """
-        # 1. Fetch Slack thread
-        thread_data = self.fetch_slack_thread(channel_id, thread_ts)
-        if not thread_data or 'messages' not in thread_data:
-            print("Could not retrieve thread data. Exiting.")
-            sys.exit(1)
+        # 1. Fetch Slack thread, paging users.list in the background meanwhile.
+        # The prefetch stops after its current page once the thread is in (or
+        # has failed); participants it hadn't reached are looked up individually
+        # in format_conversation.
+        stop_prefetch = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            users_future = executor.submit(self._prime_user_cache, stop=stop_prefetch)
+            try:
+                thread_data = self.fetch_slack_thread(channel_id, thread_ts)
+            finally:
+                stop_prefetch.set()
+            users_future.result()
+        if not thread_data or not thread_data.get('messages'):
+            raise IncidentReportError("Could not retrieve thread data.")
 
         # Determine the incident date from the timestamp of the first message
         first_message = thread_data['messages'][0]
@@ -385,8 +612,7 @@ class SlackIncidentReporter:
         # 3. Analyze with Groq API
         analysis = self.analyze_with_groq(conversation_text)
         if not analysis:
-            print("Analysis failed. Exiting.")
-            sys.exit(1)
+            raise IncidentReportError("Analysis failed.")
             
         # 4. Assemble the local document from the AI's analysis
         # Use .get() for safety in case the AI misses a field
@@ -400,10 +626,10 @@ class SlackIncidentReporter:
         affected_resources = analysis.get("affected_resources", "")
         root_cause = analysis.get("root_cause_text", "")
         remediation = analysis.get("remediation_steps_text", "")
-        timeline = analysis.get("timeline_markdown", "")
+        timeline = _markdown_list(analysis.get("timeline", []))
         impact = analysis.get("impact_text", "")
-        what_went_well = analysis.get("what_went_well_markdown", "")
-        what_went_wrong = analysis.get("what_went_wrong_markdown", "")
+        what_went_well = _markdown_list(analysis.get("what_went_well", []), numbered=True)
+        what_went_wrong = _markdown_list(analysis.get("what_went_wrong", []), numbered=True)
 
         report_title = f"Incident Report: {summary}"
         
@@ -474,7 +700,12 @@ def main():
         print(f"Using message ID as timestamp: {thread_ts}")
     
     reporter = SlackIncidentReporter()
-    report_path = reporter.process_incident(SLACK_CHANNEL_ID, thread_ts)
+    try:
+        report_path = reporter.process_incident(SLACK_CHANNEL_ID, thread_ts)
+    except IncidentReportError as e:
+        print(e)
+        print("Exiting.")
+        sys.exit(1)
     
     if report_path:
         # Get the markdown file path by replacing .html with .md